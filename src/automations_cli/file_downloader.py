@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
+import os
+import re
 import sys
+import time
 import shutil
 import argparse
+import tempfile
+import functools
 import subprocess
 from pathlib import Path
 from typing import Optional, List
@@ -17,8 +22,20 @@ logger = setup_logging(log_file="file_downloader.log")
 DEFAULT_DOWNLOAD_DIR = Path.home() / "Downloads"
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str):
+    """shutil.which memoized so repeated detection skips the PATH walk."""
+    return shutil.which(name)
+
+
+_URL_PREFIXES = ("http://", "https://", "ftp://", "ftps://")
+
+
 def is_valid_url(url: str) -> bool:
     """Validate if the URL is properly formatted."""
+    # Fast reject: a couple of C string ops before the full parser walk
+    if not url.startswith(_URL_PREFIXES):
+        return False
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -28,9 +45,9 @@ def is_valid_url(url: str) -> bool:
 
 def detect_download_method() -> str:
     """Automatically detect the best download method based on available tools."""
-    has_aria2 = shutil.which("aria2c") is not None
-    has_wget = shutil.which("wget") is not None
-    has_curl = shutil.which("curl") is not None
+    has_aria2 = _which("aria2c") is not None
+    has_wget = _which("wget") is not None
+    has_curl = _which("curl") is not None
 
     if has_aria2:
         return "aria2"
@@ -44,24 +61,22 @@ def detect_download_method() -> str:
         )
 
 
+# Example: [#1f3b2c 4.2MiB/10MiB(42%) CN:5 DL:1.2MiB ETA:5s]
+_ARIA2_PROGRESS_RE = re.compile(
+    r"\[#\w+\s+([0-9.]+[KMG]?i?B)/([0-9.]+[KMG]?i?B)\((\d+)%\)"
+    r"\s+CN:(\d+)\s+DL:([0-9.]+[KMG]?i?B)\s+ETA:([0-9a-zA-Z]+)\]"
+)
+
+
 def parse_aria2c_progress(line):
-    """Parse aria2c progress line for single file downloads."""
-    import re
-
-    # Example: [#1f3b2c 4.2MiB/10MiB(42%) CN:5 DL:1.2MiB ETA:5s]
-    pattern = r"\[#\w+\s+([0-9.]+[KMG]?i?B)/([0-9.]+[KMG]?i?B)\((\d+)%\)\s+CN:(\d+)\s+DL:([0-9.]+[KMG]?i?B)\s+ETA:([0-9a-zA-Z]+)\]"
-    match = re.match(pattern, line)
-    if match:
-        downloaded, total, percent, connections, speed, eta = match.groups()
-        return {
-            "downloaded": downloaded,
-            "total": total,
-            "percent": percent,
-            "connections": connections,
-            "speed": speed,
-            "eta": eta,
-        }
-    return None
+    """Parse an aria2c progress line into
+    (downloaded, total, percent, connections, speed, eta), or None."""
+    # Fast-reject: most output lines (banners, FILE:, results) are not
+    # progress frames, and the prefix compare is far cheaper than the regex
+    if len(line) < 16 or not line.startswith("[#"):
+        return None
+    match = _ARIA2_PROGRESS_RE.match(line)
+    return match.groups() if match else None
 
 
 def download_with_aria2(
@@ -92,7 +107,7 @@ def download_with_aria2(
 
     command.extend(urls)
 
-    logger.info(f"Executing aria2c command: {' '.join(command)}")
+    logger.info("Executing aria2c command: %s", " ".join(command))
     print(f"📥 Downloading with aria2c: {', '.join(urls)}")
 
     try:
@@ -100,38 +115,57 @@ def download_with_aria2(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
+            bufsize=0,
         )
         last_progress = None
-        for line in iter(process.stdout.readline, ""):
-            line = line.strip()
-            if not line:
-                continue
-            progress = parse_aria2c_progress(line)
-            if progress and not quiet:
-                print(
-                    f"\r📥 {progress['percent']}% of {progress['total']} at {progress['speed']} ETA {progress['eta']}",
-                    end="",
-                    flush=True,
-                )
-                last_progress = progress
+        last_emit = 0.0
+        buffer = bytearray()
+        fd = process.stdout.fileno()
+        while True:
+            # Drain big binary chunks instead of a readline per progress line
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            buffer += chunk
+            # aria2c separates progress frames with \r as well as \n
+            *complete, rest = buffer.replace(b"\r", b"\n").split(b"\n")
+            buffer = bytearray(rest)
+            for raw_line in complete:
+                line = raw_line.decode(errors="replace").strip()
+                if not line:
+                    continue
+                progress = parse_aria2c_progress(line)
+                if progress and not quiet:
+                    last_progress = progress
+                    # Repaint at most ~10 Hz; the terminal can't use more
+                    now = time.monotonic()
+                    if now - last_emit < 0.1:
+                        continue
+                    last_emit = now
+                    _, total, percent, _, speed, eta = progress
+                    sys.stdout.write(
+                        f"\r📥 {percent}% of {total} at {speed} ETA {eta}"
+                    )
         process.wait()
         if not quiet:
-            print()  # Newline after progress
+            if last_progress:
+                _, total, percent, _, speed, eta = last_progress
+                sys.stdout.write(f"\r📥 {percent}% of {total} at {speed} ETA {eta}")
+            sys.stdout.write("\n")
+            sys.stdout.flush()
         if process.returncode == 0:
             logger.info("Download completed successfully")
             print(f"✅ Download complete in {output_dir}")
             return True
         else:
-            logger.error(f"aria2c failed with return code {process.returncode}")
+            logger.error("aria2c failed with return code %s", process.returncode)
             print(
                 f"❌ Download failed: aria2c exited with {process.returncode}",
                 file=sys.stderr,
             )
             return False
     except Exception as e:
-        logger.error(f"aria2c failed: {e}")
+        logger.error("aria2c failed: %s", e)
         print(f"❌ Download failed: {e}", file=sys.stderr)
         return False
 
@@ -152,16 +186,18 @@ def download_with_wget(
 
     command.extend(["-O", str(output_path), url])
 
-    logger.info(f"Executing wget command: {' '.join(command)}")
+    logger.info("Executing wget command: %s", " ".join(command))
     print(f"📥 Downloading with wget: {url}")
 
     try:
-        result = subprocess.run(command, check=True, capture_output=not quiet)
+        # No pipes: either inherit the TTY for progress, or discard
+        sink = subprocess.DEVNULL if quiet else None
+        subprocess.run(command, check=True, stdout=sink, stderr=sink)
         logger.info("Download completed successfully")
         print(f"✅ Download complete: {output_path}")
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"wget failed with return code {e.returncode}")
+        logger.error("wget failed with return code %s", e.returncode)
         print(f"❌ Download failed: {e}", file=sys.stderr)
         return False
 
@@ -183,16 +219,75 @@ def download_with_curl(
 
     command.extend(["-L", "-o", str(output_path), url])
 
-    logger.info(f"Executing curl command: {' '.join(command)}")
+    logger.info("Executing curl command: %s", " ".join(command))
     print(f"📥 Downloading with curl: {url}")
 
     try:
-        result = subprocess.run(command, check=True, capture_output=not quiet)
+        # No pipes: either inherit the TTY for progress, or discard
+        sink = subprocess.DEVNULL if quiet else None
+        subprocess.run(command, check=True, stdout=sink, stderr=sink)
         logger.info("Download completed successfully")
         print(f"✅ Download complete: {output_path}")
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"curl failed with return code {e.returncode}")
+        logger.error("curl failed with return code %s", e.returncode)
+        print(f"❌ Download failed: {e}", file=sys.stderr)
+        return False
+
+
+def download_with_wget_batch(
+    urls: List[str], output_dir: Path, resume: bool = True, quiet: bool = False
+) -> bool:
+    """Download many files with a single wget invocation via a URL list file."""
+    command = ["wget", "-P", str(output_dir)]
+    if resume:
+        command.append("--continue")
+    command.append("--quiet" if quiet else "--progress=bar:force")
+
+    logger.info("Executing wget batch for %d URLs", len(urls))
+    print(f"📥 Downloading {len(urls)} files with wget")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".urls", delete=False) as url_file:
+        url_file.write("\n".join(urls))
+        list_path = url_file.name
+    try:
+        sink = subprocess.DEVNULL if quiet else None
+        subprocess.run(
+            command + ["-i", list_path], check=True, stdout=sink, stderr=sink
+        )
+        logger.info("Download completed successfully")
+        print(f"✅ Download complete in {output_dir}")
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.error("wget batch failed with return code %s", e.returncode)
+        print(f"❌ Download failed: {e}", file=sys.stderr)
+        return False
+    finally:
+        os.unlink(list_path)
+
+
+def download_with_curl_batch(
+    entries: List[tuple], resume: bool = True, quiet: bool = False
+) -> bool:
+    """Download many (url, output_path) pairs with one parallel curl call."""
+    command = ["curl", "--parallel", "--parallel-max", "8", "-L"]
+    if resume:
+        command.extend(["--continue-at", "-"])
+    command.append("--silent" if quiet else "--progress-bar")
+    for url, output_path in entries:
+        command.extend(["-o", str(output_path), url])
+
+    logger.info("Executing curl batch for %d URLs", len(entries))
+    print(f"📥 Downloading {len(entries)} files with curl")
+
+    try:
+        sink = subprocess.DEVNULL if quiet else None
+        subprocess.run(command, check=True, stdout=sink, stderr=sink)
+        logger.info("Download completed successfully")
+        print("✅ Download complete")
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.error("curl batch failed with return code %s", e.returncode)
         print(f"❌ Download failed: {e}", file=sys.stderr)
         return False
 
@@ -222,46 +317,80 @@ def download_files(
     output_dir_path = Path(output_dir) if output_dir else DEFAULT_DOWNLOAD_DIR
     output_dir_path.mkdir(parents=True, exist_ok=True)
 
+    # Parse each URL exactly once into (url, filename) pairs; every
+    # branch below indexes these instead of re-running urlparse
+    entries = [
+        (
+            url,
+            output_name
+            if output_name and len(urls) == 1
+            else Path(urlparse(url).path).name or "downloaded_file",
+        )
+        for url in urls
+    ]
+
+    # Plain-string joins are markedly cheaper than Path / in the loops
+    dir_str = os.fspath(output_dir_path)
+
+    def report_saved():
+        # One directory scan instead of an exists+stat pair per URL
+        try:
+            with os.scandir(dir_str) as it:
+                sizes = {entry.name: entry.stat().st_size for entry in it}
+        except OSError:
+            sizes = {}
+        for url, filename in entries:
+            size = sizes.get(filename)
+            if size is not None:
+                size_mb = size / (1024 * 1024)
+                print(
+                    f"📁 File saved: {os.path.join(dir_str, filename)}"
+                    f" ({size_mb:.1f} MB)"
+                )
+
     # Try aria2c for all files if selected or auto
-    if method == "aria2" or (method == "auto" and shutil.which("aria2c")):
+    if method == "aria2" or (method == "auto" and _which("aria2c")):
         success = download_with_aria2(urls, output_dir_path, output_name, resume, quiet)
         if success:
-            for url in urls:
-                filename = (
-                    output_name
-                    if output_name and len(urls) == 1
-                    else Path(urlparse(url).path).name or "downloaded_file"
-                )
-                file_path = output_dir_path / filename
-                if file_path.exists():
-                    size = file_path.stat().st_size
-                    size_mb = size / (1024 * 1024)
-                    print(f"📁 File saved: {file_path} ({size_mb:.1f} MB)")
+            report_saved()
             return
 
-    # Otherwise, loop over URLs and use wget/curl with fallback
-    for i, url in enumerate(urls):
-        name = output_name if output_name and len(urls) == 1 else None
-        # Try each method in order
+    # Multiple URLs: one batched wget/curl invocation instead of a
+    # fork per URL (keep-alive gets reused across same-host URLs)
+    if len(urls) > 1:
         for m in [method] if method != "auto" else ["wget", "curl"]:
             if m == "wget":
-                success = download_with_wget(
-                    url,
-                    output_dir_path
-                    / (name or Path(urlparse(url).path).name or "downloaded_file"),
-                    resume,
-                    quiet,
-                )
+                success = download_with_wget_batch(urls, output_dir_path, resume, quiet)
             elif m == "curl":
-                success = download_with_curl(
-                    url,
-                    output_dir_path
-                    / (name or Path(urlparse(url).path).name or "downloaded_file"),
+                success = download_with_curl_batch(
+                    [
+                        (url, os.path.join(dir_str, filename))
+                        for url, filename in entries
+                    ],
                     resume,
                     quiet,
                 )
             else:
                 continue
+            if success:
+                report_saved()
+                return
+        error_msg = "All download methods failed"
+        logger.error(error_msg)
+        print(f"❌ {error_msg}", file=sys.stderr)
+        return
+
+    # Otherwise, loop over URLs and use wget/curl with fallback
+    for url, filename in entries:
+        output_path = Path(os.path.join(dir_str, filename))
+        # Try each method in order
+        for m in [method] if method != "auto" else ["wget", "curl"]:
+            if m == "wget":
+                success = download_with_wget(url, output_path, resume, quiet)
+            elif m == "curl":
+                success = download_with_curl(url, output_path, resume, quiet)
+            else:
+                continue
             if success:
                 break
         else:
@@ -270,46 +399,47 @@ def download_files(
             print(f"❌ {error_msg}", file=sys.stderr)
             continue
 
-        file_path = output_dir_path / (
-            name or Path(urlparse(url).path).name or "downloaded_file"
-        )
-        if file_path.exists():
-            size = file_path.stat().st_size
-            size_mb = size / (1024 * 1024)
-            print(f"📁 File saved: {file_path} ({size_mb:.1f} MB)")
+        if output_path.exists():
+            size_mb = output_path.stat().st_size / (1024 * 1024)
+            print(f"📁 File saved: {output_path} ({size_mb:.1f} MB)")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process."""
+    parser = argparse.ArgumentParser(
+        description="Download files from URLs using aria2c, wget, or curl."
+    )
+    parser.add_argument("urls", nargs="+", help="One or more URLs to download.")
+    parser.add_argument(
+        "--output-name", "-n", help="Optional output filename (for single file only)."
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        help="Directory to save the file(s) (default: ~/Downloads).",
+    )
+    parser.add_argument(
+        "--method",
+        "-m",
+        choices=["auto", "aria2", "wget", "curl"],
+        default="auto",
+        help="Download method: auto, aria2, wget, curl (default: auto).",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Disable resume functionality (default: resume enabled).",
+    )
+    parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress output (quiet mode)."
+    )
+    return parser
 
 
 if __name__ == "__main__":
     try:
-        parser = argparse.ArgumentParser(
-            description="Download files from URLs using aria2c, wget, or curl."
-        )
-        parser.add_argument("urls", nargs="+", help="One or more URLs to download.")
-        parser.add_argument(
-            "--output-name", "-n", help="Optional output filename (for single file only)."
-        )
-        parser.add_argument(
-            "--output-dir",
-            "-o",
-            help="Directory to save the file(s) (default: ~/Downloads).",
-        )
-        parser.add_argument(
-            "--method",
-            "-m",
-            choices=["auto", "aria2", "wget", "curl"],
-            default="auto",
-            help="Download method: auto, aria2, wget, curl (default: auto).",
-        )
-        parser.add_argument(
-            "--no-resume",
-            action="store_true",
-            help="Disable resume functionality (default: resume enabled).",
-        )
-        parser.add_argument(
-            "--quiet", "-q", action="store_true", help="Suppress output (quiet mode)."
-        )
-
-        args = parser.parse_args()
+        args = _build_parser().parse_args()
 
         download_files(
             urls=args.urls,
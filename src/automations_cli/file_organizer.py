@@ -2,16 +2,19 @@
 import os
 import re
 import sys
+import errno
 import shutil
 import logging
 import argparse
+import functools
+import threading
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from collections import defaultdict
-from itertools import combinations, zip_longest
+from collections import Counter, defaultdict
 from typing import List, Dict, Set, Optional, Union
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 
 from tqdm import tqdm
 from send2trash import send2trash
@@ -98,6 +101,19 @@ class FileTypes(Enum):
     FONT = (".ttf", ".otf", ".woff", ".woff2", ".eot")
 
 
+# Month names indexed by month-1; skips a locale-aware strftime per file
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Flat extension -> FileTypes table, one hash lookup per suffix instead
+# of a linear scan over every type's extension tuple
+_EXT_TO_TYPE: Dict[str, FileTypes] = {
+    ext: file_type for file_type in FileTypes for ext in file_type.value
+}
+
+
 class SortMethod(Enum):
     """Enum for sorting methods."""
 
@@ -118,6 +134,8 @@ class FileOrganizer:
         dry_run: bool = False,
         verbose: bool = False,
         to_exclude_files: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        trash_empty: bool = False,
     ):
         """Initialize FileOrganizer.
 
@@ -128,6 +146,8 @@ class FileOrganizer:
             dry_run: Whether to perform a dry run without actual file operations
             verbose: Whether to enable verbose logging
             to_exclude_files: List of files or folders to exclude from organization
+            concurrency: Worker threads for overlapping move I/O
+            trash_empty: Send empty folders to trash instead of rmdir
         """
         self.to_sort_path = Path(to_sort_path)
         self.methods = methods
@@ -138,29 +158,36 @@ class FileOrganizer:
         self.stats = OrganizationStats()
         self.destination_folders = set()
         self.progress_bar = None
+        self.concurrency = concurrency or min(32, (os.cpu_count() or 4) * 4)
+        self.trash_empty = trash_empty
+        self._stats_lock = threading.Lock()
 
         if not isinstance(self.to_exclude_files, list):
             raise TypeError(
                 "to_exclude_files argument must be a list of file or folder names!"
             )
 
+        # O(1) membership tests in the traversal hot loop
+        self._exclude_set = frozenset(self.to_exclude_files)
+
         # Configure logging level based on verbose flag
         if self.verbose:
             logger.setLevel(logging.DEBUG)
+        else:
+            # No bar in quiet mode: drop even the per-file branch
+            self.update_progress = lambda *args, **kwargs: None
 
     def log_verbose(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
         if self.verbose:
             logger.info(message)
 
-    def update_progress(self, description: str = None) -> None:
-        """Update progress bar with optional description."""
+    def update_progress(self, count: int = 1) -> None:
+        """Advance the progress bar; rebound to a no-op when disabled."""
         if self.progress_bar:
-            if description:
-                self.progress_bar.set_description(description)
-            self.progress_bar.update(1)
+            self.progress_bar.update(count)
 
-    def map_file_extensions(self) -> Dict[str, Path]:
+    def map_file_extensions(self, files: Optional[List[Path]] = None) -> Dict[str, Path]:
         """Map file extensions to their destination folders."""
         default_paths = {
             file_type: self.to_sort_path / f"{file_type.name.title()} files"
@@ -169,155 +196,345 @@ class FileOrganizer:
 
         mapped_files = defaultdict(lambda: self.to_sort_path / "Others")
 
-        for file in self.get_files():
-            for file_type, path in default_paths.items():
-                if file.suffix.lower() in file_type.value:
-                    mapped_files[file.suffix] = path
-                    break
+        for file in files if files is not None else self.iter_files():
+            if file.suffix in mapped_files:
+                continue
+            file_type = _EXT_TO_TYPE.get(file.suffix.lower())
+            if file_type is not None:
+                mapped_files[file.suffix] = default_paths[file_type]
 
         return mapped_files
 
-    def should_exclude(self, file: Path) -> bool:
+    def should_exclude(self, file: Union[str, Path]) -> bool:
         """Check if a file or folder should be excluded."""
-        return any(to_exclude in file.parts for to_exclude in self.to_exclude_files)
+        if not self._exclude_set:
+            return False
+        # One string split + set intersection, no Path.parts tuple
+        return not self._exclude_set.isdisjoint(os.fspath(file).split(os.sep))
+
+    def _scan(self, root: Union[str, Path], recursive: bool, want_dirs: bool):
+        """Yield DirEntry objects under root with os.scandir.
+
+        DirEntry.is_file/is_dir reuse the dirent type from the directory
+        read, so the walk costs no extra stat per entry; excluded names
+        are skipped before any type check, and excluded directories are
+        never descended into.
+        """
+        exclude = self._exclude_set  # LOAD_FAST in the per-entry loop
+        stack = [os.fspath(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name in exclude:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if want_dirs:
+                                yield entry
+                            if recursive:
+                                stack.append(entry.path)
+                        elif not want_dirs and entry.is_file(follow_symlinks=False):
+                            yield entry
+            except OSError as e:
+                logger.warning(f"Cannot scan {current}: {e}")
 
     def get_folders(self) -> List[Path]:
         """Get all folders in the directory to sort."""
-        if self.recursive:
-            return [
-                folder
-                for folder in self.to_sort_path.rglob("*/")
-                if not self.should_exclude(folder)
-            ]
+        return [
+            Path(entry.path)
+            for entry in self._scan(self.to_sort_path, self.recursive, want_dirs=True)
+        ]
+
+    def iter_files(self, folder: Optional[Path] = None):
+        """Yield files lazily for single-pass consumers (O(1) memory)."""
+        if folder is not None:
+            scan = self._scan(folder, recursive=False, want_dirs=False)
         else:
-            return [
-                folder
-                for folder in self.to_sort_path.glob("*/")
-                if not self.should_exclude(folder)
-            ]
+            scan = self._scan(self.to_sort_path, self.recursive, want_dirs=False)
+        for entry in scan:
+            yield Path(entry.path)
 
     def get_files(self, folder: Optional[Path] = None) -> List[Path]:
         """Get all files in the directory to sort or in a specific folder."""
         if folder is not None:
             return [
-                file
-                for file in folder.glob("*")
-                if file.is_file() and not self.should_exclude(file)
+                Path(entry.path)
+                for entry in self._scan(folder, recursive=False, want_dirs=False)
             ]
+        return [
+            Path(entry.path)
+            for entry in self._scan(self.to_sort_path, self.recursive, want_dirs=False)
+        ]
 
-        if self.recursive:
-            return [
-                Path(root) / file
-                for root, _, files in os.walk(self.to_sort_path)
-                for file in files
-                if not self.should_exclude(Path(root) / file)
-            ]
-        else:
-            return [
-                file
-                for file in self.to_sort_path.glob("*")
-                if file.is_file() and not self.should_exclude(file)
-            ]
+    def get_files_with_mtime(self) -> List[tuple]:
+        """Like get_files, but carries the scandir-cached mtime along.
+
+        DirEntry.stat() reuses the entry's cached result, so the whole
+        listing costs one statx per file instead of a later stat round.
+        """
+        return [
+            (Path(entry.path), entry.stat().st_mtime)
+            for entry in self._scan(self.to_sort_path, self.recursive, want_dirs=False)
+        ]
 
     def get_file_date(self, file: Path) -> datetime:
         """Get file modification date."""
         return datetime.fromtimestamp(file.stat().st_mtime)
 
-    def move_file(self, file: Path, dest: Path) -> bool:
+    def move_file(self, file: Path, dest: Path) -> Optional[Path]:
         """Move a file to a destination folder.
 
+        The hot path runs on plain path strings (os.path stays in C);
+        Paths are only built for the result and user-facing logging.
+
         Args:
             file: File to move
             dest: Destination folder
 
         Returns:
-            True if file was moved successfully, False otherwise
+            The file's new Path if it was moved, None otherwise
         """
-        if dest.exists() and dest.is_file():
+        dest_str = os.fspath(dest)
+        if os.path.isfile(dest_str):
             self.log_verbose(
                 f"Destination folder has same name as file. Using parent: {dest.parent}"
             )
             dest = dest.parent
+            dest_str = os.fspath(dest)
 
-        destination_file = dest / file.name
+        destination_str = os.path.join(dest_str, file.name)
 
         if self.dry_run:
             self.log_verbose(f"[DRY RUN] Would move {file} to {dest}")
-            return True
+            return None
+
+        destination_file = Path(destination_str)
+        if os.path.lexists(destination_str):
+            # Only a same-directory move can be a self-move, so the
+            # two-stat samefile probe is reserved for that rare case
+            if os.fspath(file.parent) == dest_str and os.path.samefile(
+                file, destination_str
+            ):
+                with self._stats_lock:
+                    self.stats.skipped_files += 1
+                return None
+            destination_file = new_filepath(destination_file, add_prefix="_Duplicate")
+
+        self.log_verbose(f"Moving {file} to {dest}")
+        try:
+            try:
+                # Same-filesystem fast path: one metadata-only rename
+                os.rename(file, destination_file)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Crossing devices: fall back to copy+unlink
+                shutil.move(str(file), str(destination_file))
+            with self._stats_lock:
+                self.stats.moved_files += 1
+            return destination_file
+        except FileNotFoundError:
+            logger.warning(f"Not moved: {file}, file may be deleted.")
+            with self._stats_lock:
+                self.stats.errors += 1
+            return None
 
-        folder_created = not dest.exists()
-        dest.mkdir(parents=True, exist_ok=True)
-        self.stats.created_folders += 1 if folder_created else 0
+    def _prepare_destinations(self, dests) -> None:
+        """Create each unique destination folder once, ahead of the moves."""
+        if self.dry_run:
+            return
+        for dest in dests:
+            if not dest.exists():
+                dest.mkdir(parents=True, exist_ok=True)
+                self.stats.created_folders += 1
+
+    @staticmethod
+    def _claim_duplicate(destination_str: str, claimed: Set[str]) -> str:
+        """Pick a _Duplicate(N) name free both on disk and in this batch."""
+        base = Path(destination_str)
+        parent = os.path.dirname(destination_str)
+        count = 1
+        while True:
+            candidate = os.path.join(
+                parent, f"{base.stem}_Duplicate({count}){base.suffix}"
+            )
+            if candidate not in claimed and not os.path.lexists(candidate):
+                return candidate
+            count += 1
 
-        if destination_file.exists() and not destination_file.samefile(file):
-            destination_file = new_filepath(destination_file, add_prefix="_Duplicate")
+    def _resolve_destinations(self, pairs: List[tuple]) -> List[tuple]:
+        """Assign each pair its unique final destination, single-threaded.
 
-        if not destination_file.exists():
-            self.log_verbose(f"Moving {file} to {dest}")
+        Collision handling cannot run inside the pool: two workers racing
+        the same name both pass the lexists probe and the second rename
+        silently replaces the first file. Claiming names up front (against
+        the disk and against this batch) makes the workers overwrite-free.
+        """
+        claimed: Set[str] = set()
+        resolved = []
+        for file, dest in pairs:
+            dest_str = os.fspath(dest)
+            if os.path.isfile(dest_str):
+                self.log_verbose(
+                    f"Destination folder has same name as file. Using parent: {dest.parent}"
+                )
+                dest_str = os.path.dirname(dest_str)
+
+            destination_str = os.path.join(dest_str, file.name)
+            if destination_str in claimed or os.path.lexists(destination_str):
+                # Only a same-directory move can be a self-move
+                if (
+                    destination_str not in claimed
+                    and os.fspath(file.parent) == dest_str
+                    and os.path.samefile(file, destination_str)
+                ):
+                    resolved.append((file, None))  # skip: already in place
+                    continue
+                destination_str = self._claim_duplicate(destination_str, claimed)
+
+            claimed.add(destination_str)
+            resolved.append((file, Path(destination_str)))
+        return resolved
+
+    def _move_resolved(self, file: Path, destination_file: Optional[Path]):
+        """Pool worker: move to a pre-claimed destination (no collision checks)."""
+        if destination_file is None:
+            if not self.dry_run:
+                with self._stats_lock:
+                    self.stats.skipped_files += 1
+            return None
+
+        if self.dry_run:
+            self.log_verbose(f"[DRY RUN] Would move {file} to {destination_file.parent}")
+            return None
+
+        self.log_verbose(f"Moving {file} to {destination_file.parent}")
+        try:
             try:
+                # Same-filesystem fast path: one metadata-only rename
+                os.rename(file, destination_file)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Crossing devices: fall back to copy+unlink
                 shutil.move(str(file), str(destination_file))
+            with self._stats_lock:
                 self.stats.moved_files += 1
-                return True
-            except FileNotFoundError:
-                logger.warning(f"Not moved: {file}, file may be deleted.")
+            return destination_file
+        except FileNotFoundError:
+            logger.warning(f"Not moved: {file}, file may be deleted.")
+            with self._stats_lock:
                 self.stats.errors += 1
-                return False
-        else:
-            self.stats.skipped_files += 1
-            return False
+            return None
+
+    def _move_files(self, pairs: List[tuple], description: str) -> List[Optional[Path]]:
+        """Move (file, dest) pairs on a thread pool to overlap rename I/O.
 
-    def sort_by_type(self) -> None:
+        Returns the new path per pair (None where nothing moved), so
+        callers can keep their file lists current without re-walking.
+        """
+        if not pairs:
+            return []
+        # Collisions are resolved here, before any worker runs
+        resolved = self._resolve_destinations(pairs)
+        # K unique destinations get K mkdir calls, not one per file
+        self._prepare_destinations({dest for _, dest in pairs})
+        if self.progress_bar:
+            # Description set once per batch, ticks batched in chunks
+            self.progress_bar.set_description(description)
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self._move_resolved, file, destination)
+                for file, destination in resolved
+            ]
+            for i, future in enumerate(futures, 1):
+                results.append(future.result())
+                if i % 64 == 0:
+                    self.update_progress(64)
+        self.update_progress(len(pairs) % 64)
+        return results
+
+    def sort_by_type(self, files: Optional[List[Path]] = None) -> List[Path]:
         """Sort files by their type (extension category)."""
         self.log_verbose("Starting sort by type...")
-        unsorted_files = self.get_files()
-        mapped_files = self.map_file_extensions()
+        unsorted_files = files if files is not None else self.get_files()
+        mapped_files = self.map_file_extensions(unsorted_files)
 
+        pairs = []
+        append_pair = pairs.append
+        add_destination = self.destination_folders.add
         for file in unsorted_files:
             type_dest = mapped_files[file.suffix]
-            self.move_file(file, type_dest)
-            self.destination_folders.add(type_dest)
-            self.update_progress("Sorting by type")
+            append_pair((file, type_dest))
+            add_destination(type_dest)
+        results = self._move_files(pairs, "Sorting by type")
 
         self.stats.method_stats["by_type"] = len(unsorted_files)
+        return [new or file for (file, _), new in zip(pairs, results)]
 
-    def sort_by_extension(self) -> None:
+    def sort_by_extension(self, files: Optional[List[Path]] = None) -> List[Path]:
         """Sort files by their specific extension."""
         self.log_verbose("Starting sort by extension...")
-        unsorted_files = self.get_files()
-        mapped_files = self.map_file_extensions()
+        unsorted_files = files if files is not None else self.get_files()
+        mapped_files = self.map_file_extensions(unsorted_files)
 
+        pairs = []
         for file in unsorted_files:
             type_dest = mapped_files[file.suffix]
             ext_name = file.suffix.strip(".") if file.suffix else "unknown"
             ext_dest = type_dest / f"{ext_name} files"
 
-            self.move_file(file, ext_dest)
+            pairs.append((file, ext_dest))
             self.destination_folders.update({type_dest, ext_dest})
-            self.update_progress("Sorting by extension")
+        results = self._move_files(pairs, "Sorting by extension")
 
         self.stats.method_stats["by_ext"] = len(unsorted_files)
+        return [new or file for (file, _), new in zip(pairs, results)]
 
-    def sort_by_date(self) -> None:
+    def sort_by_date(self, files: Optional[List[Path]] = None) -> List[Path]:
         """Sort files by their modification date."""
         self.log_verbose("Starting sort by date...")
-        unsorted_files = self.get_files()
-
-        for file in unsorted_files:
-            file_date = self.get_file_date(file)
-            year_folder = file.parent / f"{file_date.year}"
-            month_folder = (
-                year_folder / f"{file_date.month:02d}-{file_date.strftime('%B')}"
-            )
-
-            self.move_file(file, month_folder)
-            self.destination_folders.update({year_folder, month_folder})
-            self.update_progress("Sorting by date")
+        if files is None:
+            unsorted_files = self.get_files_with_mtime()
+        else:
+            # mtimes survive renames, but the paths are method-fresh;
+            # skip anything deleted since the previous method ran
+            unsorted_files = []
+            for file in files:
+                try:
+                    unsorted_files.append((file, file.stat().st_mtime))
+                except OSError:
+                    logger.warning(f"Skipping vanished file: {file}")
+
+        # Unique (parent, year, month) buckets are few; build each
+        # folder Path once and reuse it for every file in the bucket
+        folder_cache: Dict[tuple, Path] = {}
+        pairs = []
+        for file, mtime in unsorted_files:
+            file_date = datetime.fromtimestamp(mtime)
+            key = (file.parent, file_date.year, file_date.month)
+            month_folder = folder_cache.get(key)
+            if month_folder is None:
+                year_folder = file.parent / f"{file_date.year}"
+                month_folder = (
+                    year_folder / f"{file_date.month:02d}-{_MONTHS[file_date.month - 1]}"
+                )
+                folder_cache[key] = month_folder
+                self.destination_folders.update({year_folder, month_folder})
+
+            pairs.append((file, month_folder))
+        results = self._move_files(pairs, "Sorting by date")
 
         self.stats.method_stats["by_date"] = len(unsorted_files)
+        return [new or file for (file, _), new in zip(pairs, results)]
 
     def sort_by_name(self, folder: Path = None) -> None:
         """Sort files by common stems in their names."""
         self.log_verbose(f"Starting sort by stem in {folder or 'all folders'}...")
+        if self.progress_bar:
+            self.progress_bar.set_description("Sorting by stem")
         target_folder = folder or self.to_sort_path
 
         if self.recursive and folder is None:
@@ -331,43 +548,49 @@ class FileOrganizer:
             if not unsorted_files:
                 continue
 
-            common_stems = get_common_stems(unsorted_files)
+            # Split every stem exactly once; the same list feeds both the
+            # common-prefix search and the per-file matching below
+            file_stems = [split_stem_cached(file.stem) for file in unsorted_files]
+
+            common_stems = get_common_stems(file_stems)
             if not common_stems:
                 continue
 
-            file_stems = [
-                get_split_stem(SPLIT_PATTERN, TO_REPLACE_PATTERN, file.stem)
-                for file in unsorted_files
-            ]
-
+            # Hash lookups over the candidate prefixes: each file lands in
+            # its longest matching bucket, so no sorted-by-length pass and
+            # no per-candidate zip scan
+            prefix_set = {tuple(common_stem) for common_stem in common_stems}
             stem_folders = defaultdict(list)
             for file, file_stem in zip(unsorted_files, file_stems):
-                for common_stem in common_stems:
-                    if len(common_stem) <= len(file_stem) and all(
-                        x == y for x, y in zip(common_stem, file_stem)
-                    ):
-                        stem_folders[" ".join(common_stem).strip()].append(file)
+                for i in range(len(file_stem), 0, -1):
+                    key = file_stem[:i]
+                    if key in prefix_set:
+                        stem_folders[" ".join(key).strip()].append(file)
+                        break
 
             if len(stem_folders) > 1:
-                for common_stem in sorted(stem_folders.keys(), key=len, reverse=True):
-                    files = stem_folders[common_stem]
+                move = self.move_file
+                progress = self.update_progress
+                for common_stem, files in stem_folders.items():
                     if len(files) > 1:
                         for file in files:
                             if file.exists() and not set(common_stem.split()) <= set(
                                 file.parts
                             ):
                                 stem_folder = file.parent / common_stem
-                                self.move_file(file, stem_folder)
+                                self._prepare_destinations((stem_folder,))
+                                move(file, stem_folder)
                                 self.destination_folders.add(stem_folder)
                                 total_processed += 1
-                                self.update_progress("Sorting by stem")
+                                progress()
 
         self.stats.method_stats["by_stem"] = total_processed
 
     def organize(self) -> OrganizationStats:
         """Main organization method that applies all selected methods."""
         self.stats.start_time = datetime.now()
-        self.stats.total_files = len(self.get_files())
+        files = self.get_files()
+        self.stats.total_files = len(files)
 
         if self.stats.total_files == 0:
             logger.info("No files to organize.")
@@ -376,10 +599,12 @@ class FileOrganizer:
         # Store original folders before any organization
         original_folders = set(self.get_folders())
 
-        # Initialize progress bar
+        # Initialize progress bar (skipped entirely in quiet mode)
         total_operations = self.stats.total_files * len(self.methods)
-        self.progress_bar = tqdm(
-            total=total_operations, desc="Organizing files", disable=not self.verbose
+        self.progress_bar = (
+            tqdm(total=total_operations, desc="Organizing files", mininterval=0.5)
+            if self.verbose
+            else None
         )
 
         logger.info(
@@ -388,16 +613,19 @@ class FileOrganizer:
         logger.debug(f"Mode: {'Recursive' if self.recursive else 'Simple'}")
         logger.info(f"Dry run: {self.dry_run}")
 
-        # Apply each method in order
+        # Apply each method in order, threading the current paths
+        # through so later methods need no fresh tree walk
         for method in self.methods:
             if method == SortMethod.BY_TYPE:
-                self.sort_by_type()
+                files = self.sort_by_type(files)
             elif method == SortMethod.BY_EXT:
-                self.sort_by_extension()
+                files = self.sort_by_extension(files)
             elif method == SortMethod.BY_DATE:
-                self.sort_by_date()
+                files = self.sort_by_date(files)
             elif method == SortMethod.BY_STEM:
+                # Stem sort re-buckets per folder mid-flight; re-sync after
                 self.sort_by_name()
+                files = self.get_files()
 
         # Remove empty folders if not dry run
         if not self.dry_run:
@@ -416,7 +644,8 @@ class FileOrganizer:
 
             self.remove_folders(empty_folders)
 
-        self.progress_bar.close()
+        if self.progress_bar:
+            self.progress_bar.close()
         self.stats.end_time = datetime.now()
 
         # Final verification
@@ -426,32 +655,50 @@ class FileOrganizer:
         return self.stats
 
     def remove_folders(self, folders: Set[Path]) -> None:
-        """Move empty folders to trash."""
+        """Remove empty folders (a single rmdir each, or trash on request)."""
         if not folders:
             return
 
-        logger.info("Moving empty folders to trash...")
+        if self.trash_empty:
+            logger.info("Moving empty folders to trash...")
+        else:
+            logger.info("Removing empty folders...")
         for folder in folders:
-            self.log_verbose(f"Moving {folder} to trash...")
+            self.log_verbose(f"Removing {folder}...")
             try:
                 if not self.dry_run:
-                    send2trash(str(folder))
+                    if self.trash_empty:
+                        send2trash(str(folder))
+                    else:
+                        # The folder is known empty; rmdir is one syscall
+                        # and there is nothing to recover from the trash
+                        os.rmdir(folder)
                 self.stats.removed_folders += 1
             except Exception as e:
                 logger.error(f"Error removing folder {folder}: {e}")
                 self.stats.errors += 1
 
     def verify_organization(self) -> None:
-        """Verify that organization was successful."""
+        """Verify the move accounting without re-walking the tree.
+
+        Every file a sort method attempts ends up moved, skipped or
+        errored, so the counters must reconcile with the per-method
+        totals. The old full rescan doubled the run's I/O and reported
+        false misses in non-recursive mode once files had been moved
+        into subfolders.
+        """
         logger.info("Verifying organization...")
-        current_files = self.get_files()
+        attempted = sum(self.stats.method_stats.values())
+        accounted = (
+            self.stats.moved_files + self.stats.skipped_files + self.stats.errors
+        )
 
-        if len(current_files) != self.stats.total_files:
-            missing_files = self.stats.total_files - len(current_files)
+        if accounted != attempted:
+            missing_files = attempted - accounted
             logger.error(
-                f"Organization verification failed! {missing_files} files missing."
+                f"Organization verification failed! {missing_files} files unaccounted for."
             )
-            self.stats.errors += missing_files
+            self.stats.errors += abs(missing_files)
         else:
             logger.info("Organization verification successful!")
 
@@ -478,14 +725,41 @@ class FileOrganizer:
         print("=" * 50)
 
 
+# Separator punctuation becomes whitespace, then str.split does the rest
+_SPLIT_TRANSLATION = str.maketrans(".,:_-", "     ")
+
+
 def split_stem(split_pattern: re.Pattern, stem: str) -> List[str]:
-    """Split a file stem using a regex pattern."""
-    return [part for part in re.split(split_pattern, stem) if part]
+    """Split a file stem on whitespace and separator punctuation.
+
+    The pattern argument is kept for API compatibility; the split itself
+    now runs through str.translate + str.split, which stay in C.
+    """
+    return stem.translate(_SPLIT_TRANSLATION).split()
 
 
 def clean_stem(to_replace_pattern: re.Pattern, stem: str, replacement: str = "") -> str:
-    """Clean a file stem by removing patterns."""
-    return re.sub(to_replace_pattern, replacement, stem).strip()
+    """Clean a file stem by dropping bracketed [...] / (...) groups.
+
+    One depth-tracking scan, O(len) with no backtracking — the old
+    greedy regex swallowed everything between the first and last bracket
+    on stems with several groups.
+    """
+    cleaned = []
+    depth = 0
+    for char in stem:
+        if char in "([":
+            if not depth and replacement:
+                cleaned.append(replacement)
+            depth += 1
+        elif char in ")]":
+            if depth:
+                depth -= 1
+            else:
+                cleaned.append(char)
+        elif not depth:
+            cleaned.append(char)
+    return "".join(cleaned).strip()
 
 
 def get_split_stem(
@@ -496,30 +770,35 @@ def get_split_stem(
     return split_stem(split_pattern, cleaned_stem)
 
 
-def get_common_stems(files: List[Path]) -> List[List[str]]:
-    """Find common stems among file names."""
-    if len(files) < 2:
-        return []
+@functools.lru_cache(maxsize=4096)
+def split_stem_cached(stem: str) -> tuple:
+    """get_split_stem over the module patterns, memoized per stem.
 
-    file_stems = [
-        get_split_stem(SPLIT_PATTERN, TO_REPLACE_PATTERN, file.stem) for file in files
-    ]
+    Recursive sorts revisit the same names across folders and passes;
+    caching skips the re.sub + re.split work on every repeat.
+    """
+    return tuple(get_split_stem(SPLIT_PATTERN, TO_REPLACE_PATTERN, stem))
 
-    common_stems = []
-    for stem1, stem2 in combinations(file_stems, 2):
-        common_words = [
-            x
-            for x, y in zip_longest(stem1, stem2, fillvalue=None)
-            if x == y and x is not None
-        ]
-        if common_words:
-            common_stems.append(tuple(common_words))
 
-    common_stems = list(set(common_stems))
+def get_common_stems(file_stems: List[tuple]) -> List[List[str]]:
+    """Find stem prefixes shared by at least two of the split stems.
+
+    A single counting pass over every stem's prefixes replaces the old
+    pairwise combinations walk: O(N*L) instead of O(N^2 * L), and the
+    callers match candidates as prefixes anyway.
+    """
+    if len(file_stems) < 2:
+        return []
+
+    prefix_counts = Counter()
+    for file_stem in file_stems:
+        for i in range(1, len(file_stem) + 1):
+            prefix_counts[tuple(file_stem[:i])] += 1
+
     return [
-        list(common_stem)
-        for common_stem in common_stems
-        if common_stem and len(set(common_stem)) > 1
+        list(prefix)
+        for prefix, count in prefix_counts.items()
+        if count >= 2 and len(set(prefix)) > 1
     ]
 
 
@@ -575,6 +854,18 @@ def main() -> None:
         default=[],
         help="Files or folders to exclude from organization",
     )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=None,
+        help="Worker threads for moving files (default: min(32, cpus*4))",
+    )
+    parser.add_argument(
+        "--trash-empty",
+        action="store_true",
+        help="Send emptied folders to trash instead of removing them directly",
+    )
 
     args = parser.parse_args()
 
@@ -598,6 +889,8 @@ def main() -> None:
         dry_run=args.dry_run,
         verbose=args.verbose,
         to_exclude_files=args.exclude,
+        concurrency=args.concurrency,
+        trash_empty=args.trash_empty,
     )
 
     try:
@@ -5,17 +5,87 @@ Automates the creation of a full-stack project with FastAPI backend and React fr
 """
 
 import os
+import re
 import sys
 import stat
+import functools
 from pathlib import Path
-import textwrap
 
 
-def create_file(filepath: Path, content: str):
-    """Create a file with the given content, creating parent directories if needed."""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    filepath.write_text(textwrap.dedent(content).strip() + "\n", encoding='utf-8')
-    print(f"[OK] Created: {filepath}")
+# Matches each non-blank line's leading indent; the shortest one is the
+# margin to strip (templates indent with spaces only)
+_MARGIN_RE = re.compile(r"(?m)^[ \t]*(?=\S)")
+
+
+@functools.lru_cache(maxsize=None)
+def _dedent(content: str) -> bytes:
+    """Strip the common indent, trim, and UTF-8 encode — memoized.
+
+    A fused regex substitution replaces textwrap.dedent's separate
+    margin walk and rewrite passes. The bodies only vary by the
+    interpolated project name, so within a run (and across repeated
+    generations in one process) the scan and encode for a given
+    rendered body happen once.
+    """
+    margin = min(_MARGIN_RE.findall(content), key=len, default="")
+    if margin:
+        content = re.sub("(?m)^" + margin, "", content)
+    return (content.strip() + "\n").encode("utf-8")
+
+
+_created_dirs = set()
+_created_log = []
+
+
+def _ensure_parent(parent: str) -> None:
+    """Create each parent directory once per run instead of once per file."""
+    if parent in _created_dirs:
+        return
+    os.makedirs(parent, exist_ok=True)
+    _created_dirs.add(parent)
+
+
+def create_file(filepath, content: str):
+    """Create a file with the given content, creating parent directories if needed.
+
+    Accepts a Path or a plain string; the internals run on strings so
+    no intermediate PurePath objects are allocated per file.
+    """
+    path_str = os.fspath(filepath)
+    _ensure_parent(os.path.dirname(path_str))
+    # Raw open/write/close on pre-encoded bytes: no TextIOWrapper layer
+    fd = os.open(path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        os.write(fd, _dedent(content))
+    finally:
+        os.close(fd)
+    _created_log.append(path_str)
+
+
+# Empty package markers share one pre-encoded byte constant and skip
+# the dedent machinery entirely (create_file("") normalizes to "\n")
+_EMPTY_INIT = b"\n"
+
+
+def create_empty_file(filepath) -> None:
+    """Fast path for empty marker files like __init__.py."""
+    path_str = os.fspath(filepath)
+    _ensure_parent(os.path.dirname(path_str))
+    fd = os.open(path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        os.write(fd, _EMPTY_INIT)
+    finally:
+        os.close(fd)
+    _created_log.append(path_str)
+
+
+def _flush_created() -> None:
+    """Emit the buffered [OK] lines with a single stdout write."""
+    if _created_log:
+        sys.stdout.write(
+            "".join(f"[OK] Created: {path}\n" for path in _created_log)
+        )
+        _created_log.clear()
 
 
 def create_backend(root: Path, project_name: str):
@@ -99,6 +169,43 @@ def create_backend(root: Path, project_name: str):
     """)
 
     # src/{project_name}/scripts.py - Development and deployment scripts
+    # One (name, docstring, argv) row per entry point; the generated file
+    # shares a single _run helper instead of five copies of the env setup
+    script_specs = [
+        (
+            "dev",
+            "Run the development server with auto-reload.",
+            ["-m", "uvicorn", f"{package_name}.main:app", "--reload",
+             "--host", "0.0.0.0", "--port", "8000"],
+        ),
+        (
+            "start",
+            "Run the production server.",
+            ["-m", "uvicorn", f"{package_name}.main:app",
+             "--host", "0.0.0.0", "--port", "8000"],
+        ),
+        (
+            "alembic_init",
+            "Initialize Alembic for database migrations.",
+            ["-m", "alembic", "init", "alembic"],
+        ),
+        (
+            "run_migrations",
+            "Generate database migrations.",
+            ["-m", "alembic", "revision", "--autogenerate", "-m", "Initial migration"],
+        ),
+        (
+            "upgrade_db",
+            "Upgrade the database to the latest migration.",
+            ["-m", "alembic", "upgrade", "head"],
+        ),
+    ]
+    script_functions = "\n\n\n".join(
+        "def {name}():\n"
+        '    """{doc}"""\n'
+        "    _run({args})".format(name=name, doc=doc, args=", ".join(map(repr, args)))
+        for name, doc, args in script_specs
+    )
     scripts_content = f'''
 import subprocess
 import sys
@@ -106,71 +213,15 @@ import os
 from pathlib import Path
 
 
-def dev():
-    """Run the development server with auto-reload."""
-    backend_dir = Path(__file__).parent.parent.parent
-    env = dict(**os.environ)
-    env['PYTHONPATH'] = f"{{backend_dir}}/src:{{env.get('PYTHONPATH', '')}}"
-    
-    cmd = [
-        sys.executable, "-m", "uvicorn", 
-        "{package_name}.main:app",
-        "--reload",
-        "--host", "0.0.0.0",
-        "--port", "8000"
-    ]
-    subprocess.run(cmd, cwd=str(backend_dir), env=env)
-
-
-def start():
-    """Run the production server."""
+def _run(*args):
+    """Run a command from the backend root with src on PYTHONPATH."""
     backend_dir = Path(__file__).parent.parent.parent
     env = dict(**os.environ)
-    env['PYTHONPATH'] = f"{{backend_dir}}/src:{{env.get('PYTHONPATH', '')}}"
-    
-    cmd = [
-        sys.executable, "-m", "uvicorn", 
-        "{package_name}.main:app",
-        "--host", "0.0.0.0",
-        "--port", "8000"
-    ]
-    subprocess.run(cmd, cwd=str(backend_dir), env=env)
+    env[\'PYTHONPATH\'] = f"{{backend_dir}}/src:{{env.get(\'PYTHONPATH\', \'\')}}"
+    subprocess.run([sys.executable, *args], cwd=str(backend_dir), env=env)
 
 
-def alembic_init():
-    """Initialize Alembic for database migrations."""
-    backend_dir = Path(__file__).parent.parent.parent
-    env = dict(**os.environ)
-    env['PYTHONPATH'] = f"{{backend_dir}}/src:{{env.get('PYTHONPATH', '')}}"
-    
-    cmd = [
-        sys.executable, "-m", "alembic", "init", "alembic"
-    ]
-    subprocess.run(cmd, cwd=str(backend_dir), env=env)
-
-
-def run_migrations():
-    """Generate database migrations."""
-    backend_dir = Path(__file__).parent.parent.parent
-    env = dict(**os.environ)
-    env['PYTHONPATH'] = f"{{backend_dir}}/src:{{env.get('PYTHONPATH', '')}}"
-    
-    cmd = [
-        sys.executable, "-m", "alembic", "revision", "--autogenerate", "-m", "Initial migration"
-    ]
-    subprocess.run(cmd, cwd=str(backend_dir), env=env)
-
-
-def upgrade_db():
-    """Upgrade the database to the latest migration."""
-    backend_dir = Path(__file__).parent.parent.parent
-    env = dict(**os.environ)
-    env['PYTHONPATH'] = f"{{backend_dir}}/src:{{env.get('PYTHONPATH', '')}}"
-    
-    cmd = [
-        sys.executable, "-m", "alembic", "upgrade", "head"
-    ]
-    subprocess.run(cmd, cwd=str(backend_dir), env=env)
+{script_functions}
 
 
 if __name__ == "__main__":
@@ -178,8 +229,9 @@ if __name__ == "__main__":
 '''
     create_file(src_app / "scripts.py", scripts_content)
 
-    # src/{project_name}/core/__init__.py
-    create_file(src_app / "core" / "__init__.py", "")
+    # Empty package markers for the backend sub-packages
+    for subpackage in ("core", "db", "models", "schemas", "routers"):
+        create_empty_file(src_app / subpackage / "__init__.py")
 
     # src/{project_name}/core/config.py
     create_file(src_app / "core" / "config.py", f"""
@@ -198,9 +250,6 @@ if __name__ == "__main__":
     settings = Settings()
     """)
 
-    # src/{project_name}/db/__init__.py
-    create_file(src_app / "db" / "__init__.py", "")
-
     # src/{project_name}/db/database.py
     database_content = f'''
     from sqlalchemy import create_engine
@@ -225,9 +274,6 @@ if __name__ == "__main__":
     '''
     create_file(src_app / "db" / "database.py", database_content)
 
-    # src/{project_name}/models/__init__.py
-    create_file(src_app / "models" / "__init__.py", "")
-
     # Create the content as a variable to avoid f-string + triple quote issues
     models_base_content = f'''
     from sqlalchemy import Column, Integer, DateTime
@@ -252,9 +298,6 @@ if __name__ == "__main__":
     '''
     create_file(src_app / "models" / "base.py", models_base_content)
 
-    # src/{project_name}/schemas/__init__.py
-    create_file(src_app / "schemas" / "__init__.py", "")
-
     # Create the schemas/health.py content as a variable
     schemas_health_content = f'''
     from pydantic import BaseModel
@@ -292,9 +335,6 @@ if __name__ == "__main__":
     '''
     create_file(src_app / "schemas" / "health.py", schemas_health_content)
 
-    # src/{project_name}/routers/__init__.py
-    create_file(src_app / "routers" / "__init__.py", "")
-
     # Create the routers/health.py content as a variable
     routers_health_content = f'''
     from fastapi import APIRouter
@@ -1440,18 +1480,22 @@ def main(project_name: str = "my-fullstack-app", compose: bool = False):
     # Create backend and frontend
     print("\n[BACKEND] Generating backend structure...")
     create_backend(root, project_name)
+    _flush_created()
 
     print("\n[FRONTEND] Generating frontend structure...")
     create_frontend(root)
+    _flush_created()
 
     print("\n[DOCS] Creating README and .gitignore...")
     create_readme(root, project_name)
     create_gitignore(root)
     create_frontend_readme(root)
+    _flush_created()
 
     if compose:
         print("\n[COMPOSE] Creating docker-compose.yml...")
         create_docker_compose(root, project_name)
+        _flush_created()
         # Update .env with PostgreSQL URL instead of SQLite
         db_name = project_name.replace("-", "_")
         env_path = root / "backend" / ".env"
@@ -1462,6 +1506,7 @@ DEBUG=True
 
     print("\n[SCRIPT] Creating start.sh...")
     create_start_script(root, project_name)
+    _flush_created()
 
     # Print success message
     print("\n" + "=" * 60)
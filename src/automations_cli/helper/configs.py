@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 import sys
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -52,6 +55,11 @@ def setup_logging(
     logger = logging.getLogger(__name__)
     logger.setLevel(getattr(logging, log_level.upper()))
 
+    # Stop a previous queue listener before rebuilding the handler chain
+    listener = getattr(logger, "_queue_listener", None)
+    if listener is not None and listener._thread is not None:
+        listener.stop()
+
     # Remove existing handlers to avoid duplicates
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -68,11 +76,27 @@ def setup_logging(
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
-    # File handler (detailed logs)
+    # File handler (detailed logs) behind a queue, so disk writes happen
+    # on a background thread and never block the caller
     file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    logger._queue_listener = listener
+
+    def _stop_listener():
+        # Guard against a double stop when callers stop it themselves
+        if listener._thread is not None:
+            listener.stop()
+
+    atexit.register(_stop_listener)
 
     logger.debug(f"Logging initialized. Log file: {log_file}")
     return logger
@@ -1,19 +1,95 @@
 #!/usr/bin/env python3
+import os
 import sys
 import time
+import errno
+import shlex
+import select
+import asyncio
 import logging
+import ipaddress
+import threading
 import subprocess
 from pathlib import Path
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
 
 from helper import setup_logging
 
+try:
+    from pyroute2 import IPRoute
+    from pyroute2.netlink.rtnl import RTMGRP_LINK
+except ImportError:
+    IPRoute = None
+    RTMGRP_LINK = None
+
+try:
+    from wgnlpy import WireGuard as WireGuardNetlink
+except ImportError:
+    WireGuardNetlink = None
+
+# Interface flag bits from <linux/if.h>
+IFF_UP = 0x1
+IFF_LOWER_UP = 1 << 16
+
+# sysfs link state is the cheapest probe of all (open/read/close, no fork)
+_SYSFS_NET = Path("/sys/class/net")
+_HAS_SYSFS_NET = _SYSFS_NET.is_dir()
+
+# Configured once; repeated instantiation must not rebuild handler chains
+_LOGGER = None
+
+
+def _get_logger():
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = setup_logging(log_file="wireguard_activator_.log")
+    return _LOGGER
+
+
+class WGConfig(NamedTuple):
+    """A config file with its interface name parsed once at scan time."""
+
+    path: Path
+    stem: str
+
 
 class WireGuardActivator:
+    # How long a cached interface status stays valid (seconds)
+    STATUS_CACHE_TTL = 2.0
+
     def __init__(self, config_dir="/etc/wireguard", log_level=logging.INFO):
         self.config_dir = Path(config_dir)
         self.configs = []
+        self._configs_mtime_ns = None
+        self._status_cache = {}
+        self._status_cache_time = {}
         self.sudo_authenticated = False
-        self.logger = setup_logging(log_file="wireguard_activator_.log")
+        self._sudo_keepalive_stop = threading.Event()
+        self.logger = _get_logger()
+
+        # Talk to rtnetlink directly when pyroute2 is available; shelling
+        # out to ip(8) stays as the fallback.
+        try:
+            self._ipr = IPRoute() if IPRoute is not None else None
+        except Exception as e:
+            self.logger.debug("rtnetlink unavailable, using ip(8): %s", e)
+            self._ipr = None
+        # Same idea for WireGuard state: the genl 'wireguard' family gives
+        # us peer data without sudo or forking wg(8). Binding the family
+        # raises if the wireguard module is not loaded yet (the normal
+        # state before the first wg-quick up) — degrade like a missing
+        # import instead of dying before the menu appears.
+        try:
+            self._wg_nl = (
+                WireGuardNetlink() if WireGuardNetlink is not None else None
+            )
+        except Exception as e:
+            self.logger.debug("wireguard genl family unavailable: %s", e)
+            self._wg_nl = None
+        # The netlink sockets are shared between the menu and the
+        # background refresher thread
+        self._netlink_lock = threading.Lock()
 
     def authenticate_sudo(self):
         """Authenticate sudo once at the beginning to avoid repeated prompts."""
@@ -30,6 +106,10 @@ class WireGuardActivator:
                 self.sudo_authenticated = True
                 self.logger.info("Sudo authentication successful")
                 print("✅ Sudo authentication successful")
+                # Keep the sudo timestamp warm so later calls never re-prompt
+                threading.Thread(target=self._sudo_keepalive, daemon=True).start()
+                # One-time swap: every later call skips the auth re-check
+                self.run_sudo_command = self._run_sudo_command_fast
                 return True
             else:
                 self.logger.error("Sudo authentication failed")
@@ -40,16 +120,32 @@ class WireGuardActivator:
             print("❌ Sudo authentication timed out")
             return False
         except Exception as e:
-            self.logger.error(f"Sudo authentication error: {e}")
+            self.logger.error("Sudo authentication error: %s", e)
             print(f"❌ Sudo authentication error: {e}")
             return False
 
+    def _sudo_keepalive(self):
+        """Refresh the sudo timestamp periodically until told to stop."""
+        while not self._sudo_keepalive_stop.wait(50):
+            try:
+                subprocess.run(["sudo", "-nv"], timeout=5)
+            except Exception as e:
+                self.logger.debug("Sudo keepalive failed: %s", e)
+
     def run_sudo_command(self, command, timeout=30, capture_output=True):
-        """Run a sudo command with proper error handling."""
+        """Run a sudo command with proper error handling.
+
+        Rebound to _run_sudo_command_fast after the first successful
+        authentication, so the auth branch is only paid until then.
+        """
         if not self.sudo_authenticated:
             if not self.authenticate_sudo():
                 return None
 
+        return self._run_sudo_command_fast(command, timeout, capture_output)
+
+    def _run_sudo_command_fast(self, command, timeout=30, capture_output=True):
+        """run_sudo_command without the auth re-check (post-authentication)."""
         try:
             # Use sudo -n to avoid password prompts (non-interactive)
             sudo_command = ["sudo", "-n"] + command
@@ -58,15 +154,96 @@ class WireGuardActivator:
             )
             return result
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Command timed out: {' '.join(command)}")
+            self.logger.error("Command timed out: %s", shlex.join(command))
+            return None
+        except Exception as e:
+            self.logger.error("Error running command %s: %s", shlex.join(command), e)
             return None
+
+    def _run_fast(self, command, timeout=10):
+        """Run a short read-only probe without subprocess.run's timeout machinery.
+
+        Polls the child against a monotonic deadline instead of paying the
+        per-call timeout bookkeeping. close_fds=False (safe here: we open
+        no stray inheritable fds) lets CPython spawn the child via
+        posix_spawn/vfork instead of fork, skipping the page-table copy of
+        our heap; wg/ip probes spawn no grandchildren, so killing the pid
+        on expiry is enough.
+        """
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                close_fds=False,
+            )
+        except Exception as e:
+            self.logger.error("Error running command %s: %s", shlex.join(command), e)
+            return None
+
+        deadline = time.monotonic() + timeout
+        while process.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                process.kill()
+                process.wait()
+                self.logger.error("Command timed out: %s", shlex.join(command))
+                return None
+            time.sleep(min(remaining, 0.01))
+
+        stdout, _ = process.communicate()
+        return subprocess.CompletedProcess(command, process.returncode, stdout, None)
+
+    def run_sudo_fast(self, command, timeout=10):
+        """run_sudo_command variant for the high-frequency read-only probes."""
+        if not self.sudo_authenticated:
+            if not self.authenticate_sudo():
+                return None
+        return self._run_fast(["sudo", "-n"] + command, timeout)
+
+    async def _run_sudo_async(self, command, timeout=30, capture_output=True):
+        """Run a sudo command on the event loop so callers can overlap them.
+
+        With capture_output=False, stdout goes to /dev/null (no pipe
+        allocation or buffering for output nobody reads); stderr is always
+        captured for error logging.
+        """
+        if not self.sudo_authenticated:
+            if not self.authenticate_sudo():
+                return None
+
+        sudo_command = ["sudo", "-n"] + command
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *sudo_command,
+                stdout=asyncio.subprocess.PIPE
+                if capture_output
+                else asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                self.logger.error("Command timed out: %s", shlex.join(command))
+                return None
+            return subprocess.CompletedProcess(
+                sudo_command,
+                process.returncode,
+                stdout.decode() if stdout is not None else "",
+                stderr.decode(),
+            )
         except Exception as e:
-            self.logger.error(f"Error running command {' '.join(command)}: {e}")
+            self.logger.error("Error running command %s: %s", shlex.join(command), e)
             return None
 
     def find_configs(self):
         """Find all .conf files in the WireGuard directory."""
-        self.logger.debug(f"Searching for configs in: {self.config_dir}")
+        self.logger.debug("Searching for configs in: %s", self.config_dir)
 
         if not self.config_dir.exists():
             error_msg = f"WireGuard directory '{self.config_dir}' not found."
@@ -75,8 +252,23 @@ class WireGuardActivator:
             print("Please make sure WireGuard is installed and configured.")
             return False
 
-        self.configs = list(self.config_dir.glob("*.conf"))
-        self.logger.debug(f"Found {len(self.configs)} configuration files")
+        # Only re-scan the directory when its mtime changed since the last scan
+        dir_mtime_ns = self.config_dir.stat().st_mtime_ns
+        if dir_mtime_ns == self._configs_mtime_ns and self.configs:
+            return True
+
+        # Sort the bare names once; DirEntry.name needs no extra stat
+        with os.scandir(self.config_dir) as entries:
+            config_names = sorted(
+                entry.name[:-5]
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".conf")
+            )
+        self.configs = [
+            WGConfig(self.config_dir / f"{name}.conf", name) for name in config_names
+        ]
+        self._configs_mtime_ns = dir_mtime_ns
+        self.logger.debug("Found %d configuration files", len(self.configs))
 
         if not self.configs:
             warning_msg = (
@@ -86,65 +278,293 @@ class WireGuardActivator:
             print(warning_msg)
             return False
 
-        # Sort configs by filename
-        self.configs.sort(key=lambda x: x.stem)
-        config_names = [config.stem for config in self.configs]
-        self.logger.info(f"Available configurations: {', '.join(config_names)}")
+        self.logger.info("Available configurations: %s", ", ".join(config_names))
         return True
 
-    def check_interface_status(self, interface_name):
-        """Check if a WireGuard interface is active."""
-        self.logger.debug(f"Checking status for interface: {interface_name}")
+    def _query_wg_netlink(self, interface_name):
+        """Read WireGuard device state over generic netlink, or None."""
+        if self._wg_nl is None:
+            return None
+        try:
+            with self._netlink_lock:
+                info = self._wg_nl.get_interface(
+                    interface_name, spill_private_key=False
+                )
+            return str(info).strip()
+        except OSError as e:
+            if e.errno in (errno.EPERM, errno.EACCES):
+                # No CAP_NET_ADMIN — fall back to sudo wg show for good
+                self.logger.debug("wg netlink needs CAP_NET_ADMIN, using sudo wg")
+                self._wg_nl = None
+            return None
+        except Exception as e:
+            self.logger.debug("wg netlink query failed for %s: %s", interface_name, e)
+            return None
 
-        # Method 1: Check with wg command (most reliable)
-        result = self.run_sudo_command(["wg", "show", interface_name], timeout=10)
-        if result and result.returncode == 0 and result.stdout.strip():
-            self.logger.debug(f"wg show successful for {interface_name}")
-            return "🟢 ACTIVE", result.stdout.strip()
+    @staticmethod
+    def _parse_wg_dump(text):
+        """Parse `wg show all dump` output into interface and peer tables.
+
+        The dump format is strictly tab-delimited: interface lines carry 5
+        columns (ifname, private key, public key, listen port, fwmark) and
+        peer lines 9. Returns ``(interfaces, peers)`` dicts keyed by ifname.
+        """
+        interfaces = {}
+        peers = {}
+        for line in text.splitlines():
+            cols = line.split("\t")
+            if len(cols) == 5:
+                interfaces[cols[0]] = cols
+            elif len(cols) >= 9:
+                peers.setdefault(cols[0], []).append(cols)
+        return interfaces, peers
 
-        # Method 2: Check network interfaces (fallback)
+    def check_interface_status(self, interface_name):
+        """Check if a WireGuard interface is active."""
+        self.logger.debug("Checking status for interface: %s", interface_name)
+
+        # Method 1: Read the kernel's wireguard genl family directly
+        wg_info = self._query_wg_netlink(interface_name)
+        if wg_info:
+            self.logger.debug("wg netlink query successful for %s", interface_name)
+            return "🟢 ACTIVE", wg_info
+
+        # Method 1b: wg command via sudo (when netlink is unavailable)
+        if self._wg_nl is None:
+            result = self.run_sudo_fast(["wg", "show", interface_name], timeout=10)
+            if result and result.returncode == 0 and result.stdout.strip():
+                self.logger.debug("wg show successful for %s", interface_name)
+                return "🟢 ACTIVE", result.stdout.strip()
+
+        return self._check_link_status(interface_name)
+
+    @staticmethod
+    def _sysfs_link_status(interface_name):
+        """Classify a link from /sys/class/net reads, or None if unavailable.
+
+        dev->flags in sysfs never carries IFF_LOWER_UP, so carrier stands
+        in for it (reading carrier on a down link raises EINVAL).
+        """
+        if not _HAS_SYSFS_NET:
+            return None
+        base = _SYSFS_NET / interface_name
         try:
-            result = subprocess.run(
-                ["ip", "link", "show", interface_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                if "UP" in result.stdout and "LOWER_UP" in result.stdout:
-                    self.logger.debug(
-                        f"Interface {interface_name} is UP via ip command"
+            flags = int((base / "flags").read_text(), 16)
+        except (OSError, ValueError):
+            return "⚪ INACTIVE", None  # no such interface
+        if not flags & IFF_UP:
+            return "⚪ INACTIVE", None
+        try:
+            carrier = (base / "carrier").read_text().strip() == "1"
+        except OSError:
+            carrier = False
+        if carrier:
+            return "🟡 UP (No WG Data)", None
+        return "🟠 UP (Link Down)", None
+
+    def _check_link_status(self, interface_name):
+        """Classify an interface from its link flags alone (no WG data)."""
+        # Cheapest first: two sysfs reads beat netlink and ip(8) alike
+        status = self._sysfs_link_status(interface_name)
+        if status is not None:
+            return status
+
+        # Check link flags via netlink when pyroute2 is available
+        if self._ipr is not None:
+            try:
+                with self._netlink_lock:
+                    links = self._ipr.link_lookup(ifname=interface_name)
+                    flags = (
+                        self._ipr.get_links(links[0])[0]["flags"] if links else None
                     )
-                    return "🟡 UP (No WG Data)", None
-                elif "UP" in result.stdout:
-                    return "🟠 UP (Link Down)", None
-        except Exception as e:
-            self.logger.debug(f"ip command failed for {interface_name}: {e}")
+                if links:
+                    if flags & IFF_UP and flags & IFF_LOWER_UP:
+                        self.logger.debug(
+                            "Interface %s is UP via netlink", interface_name
+                        )
+                        return "🟡 UP (No WG Data)", None
+                    elif flags & IFF_UP:
+                        return "🟠 UP (Link Down)", None
+            except Exception as e:
+                self.logger.debug("netlink lookup failed for %s: %s", interface_name, e)
+            return "⚪ INACTIVE", None
+
+        # Method 2b: shell out to ip(8) when pyroute2 is unavailable,
+        # parsing the <...> token into a flag set once instead of
+        # scanning the whole stdout per flag
+        result = self._run_fast(
+            ["ip", "-o", "link", "show", interface_name], timeout=5
+        )
+        if result is not None and result.returncode == 0:
+            start = result.stdout.find("<")
+            end = result.stdout.find(">")
+            if 0 <= start < end:
+                flags = frozenset(result.stdout[start + 1 : end].split(","))
+                return self._classify_flags(flags)
+
+        return "⚪ INACTIVE", None
 
+    def get_interface_status(self, interface_name):
+        """Return the cached status while fresh, re-probing when stale."""
+        cached_at = self._status_cache_time.get(interface_name)
+        if (
+            cached_at is not None
+            and time.monotonic() - cached_at < self.STATUS_CACHE_TTL
+        ):
+            return self._status_cache[interface_name]
+        status = self.check_interface_status(interface_name)
+        self._set_cached_status(interface_name, status)
+        return status
+
+    def _set_cached_status(self, interface_name, status):
+        self._status_cache[interface_name] = status
+        self._status_cache_time[interface_name] = time.monotonic()
+
+    def _load_link_flags(self):
+        """Parse `ip -o link show` into {ifname: flag set} with one fork."""
+        flags = {}
+        result = self._run_fast(["ip", "-o", "link", "show"], timeout=5)
+        if result and result.returncode == 0:
+            for line in result.stdout.splitlines():
+                # "3: wg0: <POINTOPOINT,NOARP,UP,LOWER_UP> mtu 1420 ..."
+                parts = line.split(": ", 2)
+                if len(parts) < 3:
+                    continue
+                name = parts[1].split("@", 1)[0]
+                start = parts[2].find("<")
+                end = parts[2].find(">")
+                if 0 <= start < end:
+                    flags[name] = frozenset(parts[2][start + 1 : end].split(","))
+        return flags
+
+    @staticmethod
+    def _classify_flags(flag_names):
+        """Map a link's flag set to the menu status labels."""
+        if flag_names and "UP" in flag_names and "LOWER_UP" in flag_names:
+            return "🟡 UP (No WG Data)", None
+        if flag_names and "UP" in flag_names:
+            return "🟠 UP (Link Down)", None
         return "⚪ INACTIVE", None
 
+    @staticmethod
+    def _format_wg_dump_details(interface_cols, peer_rows):
+        """Render parsed dump columns the way `wg show` prints them."""
+        _, _, public_key, listen_port, _ = interface_cols
+        lines = [
+            f"  public key: {public_key}",
+            f"  listening port: {listen_port}",
+        ]
+        for cols in peer_rows:
+            lines.append(f"peer: {cols[1]}")
+            if cols[3] != "(none)":
+                lines.append(f"  endpoint: {cols[3]}")
+            lines.append(f"  allowed ips: {cols[4]}")
+            if cols[5] != "0":
+                lines.append(f"  latest handshake: {cols[5]}")
+            lines.append(f"  transfer: {cols[6]} B received, {cols[7]} B sent")
+        return "\n".join(lines)
+
+    def _refresh_status_cache(self):
+        """Re-probe every known interface into the status cache."""
+        if self._wg_nl is None:
+            # One `wg show all dump` covers every interface at once
+            result = self.run_sudo_fast(["wg", "show", "all", "dump"], timeout=10)
+            if result and result.returncode == 0:
+                interfaces, peers = self._parse_wg_dump(result.stdout)
+                # Without pyroute2, one `ip -o link show` replaces a
+                # per-interface fork for the non-WG leftovers
+                link_flags = self._load_link_flags() if self._ipr is None else None
+                for config in self.configs:
+                    interface_name = config.stem
+                    if interface_name in interfaces:
+                        self._set_cached_status(
+                            interface_name,
+                            (
+                                "🟢 ACTIVE",
+                                self._format_wg_dump_details(
+                                    interfaces[interface_name],
+                                    peers.get(interface_name, ()),
+                                ),
+                            ),
+                        )
+                    elif link_flags is not None:
+                        self._set_cached_status(
+                            interface_name,
+                            self._classify_flags(link_flags.get(interface_name)),
+                        )
+                    else:
+                        self._set_cached_status(
+                            interface_name, self._check_link_status(interface_name)
+                        )
+                return
+
+        names = [config.stem for config in self.configs]
+        if not names:
+            return
+
+        if self._wg_nl is not None:
+            # genl probes are microsecond-cheap and serialized on the
+            # netlink lock anyway — thread fan-out would only add overhead
+            for interface_name in names:
+                self._set_cached_status(
+                    interface_name, self.check_interface_status(interface_name)
+                )
+            return
+
+        # Individual probes are I/O-bound subprocess waits — fan them out
+        with ThreadPoolExecutor(max_workers=min(len(names), 16)) as executor:
+            for interface_name, status in zip(
+                names, executor.map(self.check_interface_status, names)
+            ):
+                self._set_cached_status(interface_name, status)
+
+    async def _status_refresher(self):
+        """Keep the status cache warm while the user reads or types."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self._refresh_status_cache)
+            except Exception as e:
+                self.logger.debug("Background status refresh failed: %s", e)
+            await asyncio.sleep(2)
+
     def display_configs(self):
         """Display available configurations with status."""
         self.logger.debug("Displaying configuration menu")
-        print("\n" + "=" * 60)
-        print("Available WireGuard Configurations:")
-        print("=" * 60)
+        lines = ["", "=" * 60, "Available WireGuard Configurations:", "=" * 60]
 
         for i, config in enumerate(self.configs, 1):
             interface_name = config.stem
-            status, _ = self.check_interface_status(interface_name)
-            print(f"{i:2d}. {interface_name:<20} {status}")
+            status, _ = self.get_interface_status(interface_name)
+            lines.append(f"{i:2d}. {interface_name:<20} {status}")
+
+        lines += ["", " 0. Exit", "=" * 60]
+        # One buffered write per frame instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    async def get_user_input(self, prompt):
+        """Get user input without blocking the event loop."""
+        # Reset terminal state
+        sys.stdout.flush()
+        sys.stderr.flush()
 
-        print("\n 0. Exit")
-        print("=" * 60)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _read():
+            try:
+                line = input(prompt)
+            except BaseException as e:
+                loop.call_soon_threadsafe(self._finish_input, future, None, e)
+            else:
+                loop.call_soon_threadsafe(self._finish_input, future, line, None)
+
+        # A daemon thread (not the default executor) so a pending read
+        # never blocks interpreter shutdown
+        threading.Thread(target=_read, daemon=True).start()
 
-    def get_user_input(self, prompt):
-        """Get user input with proper terminal handling."""
         try:
-            # Reset terminal state
-            sys.stdout.flush()
-            sys.stderr.flush()
-            return input(prompt).strip()
+            return (await future).strip()
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted by user. Goodbye!")
             return None
@@ -152,7 +572,16 @@ class WireGuardActivator:
             print("\n\n👋 EOF received. Goodbye!")
             return None
 
-    def show_menu(self):
+    @staticmethod
+    def _finish_input(future, line, error):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+
+    async def show_menu(self):
         """Show additional menu options."""
         print("\nAdditional Options:")
         print("d. Deactivate all interfaces")
@@ -161,108 +590,299 @@ class WireGuardActivator:
         print("t. Test connectivity")
         print("q. Quit")
 
-        choice = self.get_user_input("\nChoose an option (or number to activate): ")
+        choice = await self.get_user_input(
+            "\nChoose an option (or number to activate): "
+        )
         if choice is None:
             return "q"
 
-        self.logger.debug(f"Menu choice: '{choice}'")
+        self.logger.debug("Menu choice: %r", choice)
         return choice.lower()
 
-    def activate_config(self, config_path):
+    async def activate_config(self, config_path):
         """Activate the selected WireGuard configuration."""
         interface_name = config_path.stem
 
         self.logger.info(
-            f"Attempting to activate WireGuard interface: {interface_name}"
+            "Attempting to activate WireGuard interface: %s", interface_name
         )
         print(f"\n🔄 Activating WireGuard interface: {interface_name}")
 
-        # First, deactivate any currently active interfaces
-        print("📤 Deactivating existing interfaces...")
-        self.deactivate_all(quiet=True)
-
-        # Wait a moment for cleanup
-        time.sleep(1)
-
-        # Activate the selected configuration
-        print(f"📥 Bringing up interface: {interface_name}")
-        result = self.run_sudo_command(["wg-quick", "up", interface_name], timeout=45)
+        # Run deactivate-then-up as one pipeline on the event loop
+        result = await self._activate_async(interface_name)
 
         if result and result.returncode == 0:
             success_msg = f"Successfully activated {interface_name}"
             self.logger.info(success_msg)
             print(f"✅ {success_msg}")
 
-            # Wait a moment for interface to fully initialize
-            time.sleep(2)
+            # Drop the stale cache entry; the next probe sees the new state
+            self._status_cache.pop(interface_name, None)
+            self._status_cache_time.pop(interface_name, None)
 
-            # Show connection status
-            self.show_interface_details(interface_name)
+            # Wait for the link to come up instead of a fixed delay
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._wait_for_link, interface_name, True
+            )
+
+            # Show connection status (netlink work stays off the loop)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.show_interface_details, interface_name
+            )
 
         else:
             error_msg = f"Failed to activate {interface_name}"
-            self.logger.error(f"{error_msg}")
+            self.logger.error(error_msg)
             print(f"❌ {error_msg}")
 
             if result and result.stderr:
-                self.logger.error(f"stderr: {result.stderr}")
+                self.logger.error("stderr: %s", result.stderr)
                 print(f"Error details: {result.stderr}")
             elif result and result.stdout:
-                self.logger.debug(f"stdout: {result.stdout}")
+                self.logger.debug("stdout: %s", result.stdout)
                 print(f"Output: {result.stdout}")
             elif not result:
                 print("Command failed or timed out.")
 
+    def _wait_for_link(self, interface_name, up=True, timeout=5.0):
+        """Wait for a link state change via netlink events, not a fixed sleep.
+
+        With `up=True` waits for the interface to exist with LOWER_UP set;
+        otherwise waits for its DELLINK. Falls back to the historical fixed
+        delays when pyroute2 is unavailable.
+        """
+        if IPRoute is None:
+            time.sleep(2 if up else 1)
+            return
+
+        deadline = time.monotonic() + timeout
+        try:
+            with IPRoute() as ipr:
+                ipr.bind(groups=RTMGRP_LINK)
+                while True:
+                    # Re-check state first in case the event already fired
+                    links = ipr.link_lookup(ifname=interface_name)
+                    if up:
+                        if links and (
+                            ipr.get_links(links[0])[0]["flags"] & IFF_LOWER_UP
+                        ):
+                            return
+                    elif not links:
+                        return
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    ready, _, _ = select.select([ipr.fileno()], [], [], remaining)
+                    if ready:
+                        ipr.get()  # drain events; the loop re-checks state
+        except Exception as e:
+            self.logger.debug("netlink wait failed for %s: %s", interface_name, e)
+
+    def _active_interfaces(self):
+        """List interface names whose cached status is ACTIVE or UP."""
+        active = []
+        for config in self.configs:
+            interface_name = config.stem
+            status, _ = self.get_interface_status(interface_name)
+            # Match on the status marker: a substring test would also
+            # hit "⚪ INACTIVE" ("INACTIVE" contains "ACTIVE")
+            if not status.startswith("⚪"):
+                active.append(interface_name)
+        return active
+
+    async def _activate_async(self, interface_name):
+        """Deactivate existing interfaces, then bring up the selected one."""
+        loop = asyncio.get_running_loop()
+        active = await loop.run_in_executor(None, self._active_interfaces)
+
+        status, _ = await loop.run_in_executor(
+            None, self.get_interface_status, interface_name
+        )
+        if status.startswith("🟢"):
+            # Interface already up with WG data: reprogram the peers in
+            # place with wg syncconf, keeping the UDP socket and routes
+            config_path = self.config_dir / f"{interface_name}.conf"
+            print(f"🔁 Syncing configuration for {interface_name}...")
+            result = await self._run_sudo_async(
+                [
+                    "bash",
+                    "-c",
+                    f"wg syncconf {interface_name} "
+                    f"<(wg-quick strip {shlex.quote(str(config_path))})",
+                ],
+                timeout=10,
+            )
+            if result and result.returncode == 0:
+                return result
+            self.logger.debug("wg syncconf failed, falling back to down/up")
+
+        # Deactivate currently active interfaces; skip the whole phase
+        # when the cache shows nothing is up
+        if active:
+            print("📤 Deactivating existing interfaces...")
+            await self._deactivate_all_async(quiet=True, interfaces=active)
+
+            # Wait for the old link to disappear instead of sleeping
+            await loop.run_in_executor(
+                None, self._wait_for_link, interface_name, False
+            )
+
+        # Activate the selected configuration
+        print(f"📥 Bringing up interface: {interface_name}")
+        return await self._run_sudo_async(["wg-quick", "up", interface_name], timeout=45)
+
+    def _communicate_all(self, commands, timeout=10):
+        """Launch independent commands together and gather their outputs.
+
+        Collapses N sequential fork/exec round-trips into max-of-N wall
+        time; results come back in submission order (None on failure).
+        """
+        procs = []
+        for command in commands:
+            try:
+                procs.append(
+                    subprocess.Popen(
+                        command,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        close_fds=False,
+                    )
+                )
+            except Exception as e:
+                self.logger.error(
+                    "Error running command %s: %s", shlex.join(command), e
+                )
+                procs.append(None)
+
+        results = []
+        for command, process in zip(commands, procs):
+            if process is None:
+                results.append(None)
+                continue
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+                results.append(
+                    subprocess.CompletedProcess(
+                        command, process.returncode, stdout, stderr
+                    )
+                )
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self.logger.error("Command timed out: %s", shlex.join(command))
+                results.append(None)
+        return results
+
     def show_interface_details(self, interface_name):
         """Show detailed information about a specific interface."""
-        print(f"\n📊 Interface Details for {interface_name}:")
-        print("=" * 50)
+        lines = ["", f"📊 Interface Details for {interface_name}:", "=" * 50]
+
+        if self._wg_nl is None and self._ipr is None:
+            # Without netlink both probes are independent subprocesses —
+            # launch them together and gather once
+            wg_result, addr_result = self._communicate_all(
+                [
+                    ["sudo", "-n", "wg", "show", interface_name],
+                    ["ip", "addr", "show", interface_name],
+                ]
+            )
+            lines += ["", "🔍 WireGuard Status:"]
+            if wg_result and wg_result.returncode == 0 and wg_result.stdout.strip():
+                lines.append(wg_result.stdout.strip())
+            else:
+                lines.append("   No WireGuard data available")
+            lines += ["", "🌐 Network Interface:"]
+            if (
+                addr_result
+                and addr_result.returncode == 0
+                and addr_result.stdout.strip()
+            ):
+                lines.append(addr_result.stdout.strip())
+            else:
+                lines.append("   No network interface data available")
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
 
         # WireGuard status
-        print("\n🔍 WireGuard Status:")
-        result = self.run_sudo_command(["wg", "show", interface_name], timeout=10)
-        if result and result.returncode == 0 and result.stdout.strip():
-            print(result.stdout.strip())
+        lines += ["", "🔍 WireGuard Status:"]
+        wg_info = self._query_wg_netlink(interface_name)
+        if wg_info:
+            lines.append(wg_info)
+        elif self._wg_nl is None:
+            result = self.run_sudo_fast(["wg", "show", interface_name], timeout=10)
+            if result and result.returncode == 0 and result.stdout.strip():
+                lines.append(result.stdout.strip())
+            else:
+                lines.append("   No WireGuard data available")
         else:
-            print("   No WireGuard data available")
+            lines.append("   No WireGuard data available")
 
         # Network interface status
-        print("\n🌐 Network Interface:")
-        try:
-            result = subprocess.run(
-                ["ip", "addr", "show", interface_name],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                print(result.stdout.strip())
-            else:
-                print("   No network interface data available")
-        except Exception as e:
-            print(f"   Error getting network info: {e}")
+        lines += ["", "🌐 Network Interface:"]
+        if self._ipr is not None:
+            try:
+                with self._netlink_lock:
+                    links = self._ipr.link_lookup(ifname=interface_name)
+                    addrs = self._ipr.get_addr(index=links[0]) if links else []
+                if addrs:
+                    for addr in addrs:
+                        lines.append(
+                            f"   inet {addr.get_attr('IFA_ADDRESS')}"
+                            f"/{addr['prefixlen']}"
+                        )
+                else:
+                    lines.append("   No network interface data available")
+            except Exception as e:
+                lines.append(f"   Error getting network info: {e}")
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+
+        result = self._run_fast(["ip", "addr", "show", interface_name], timeout=5)
+        if result is not None and result.returncode == 0 and result.stdout.strip():
+            lines.append(result.stdout.strip())
+        else:
+            lines.append("   No network interface data available")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def deactivate_all(self, quiet=False):
         """Deactivate all active WireGuard interfaces."""
+        asyncio.run(self._deactivate_all_async(quiet=quiet))
+
+    async def _deactivate_all_async(self, quiet=False, interfaces=None):
+        """Bring down all active interfaces concurrently."""
         if not quiet:
             self.logger.info("Starting deactivation of all WireGuard interfaces")
             print("\n📤 Deactivating all WireGuard interfaces...")
 
-        deactivated_count = 0
-        for config in self.configs:
-            interface_name = config.stem
-
-            # Check if interface is active first
-            status, _ = self.check_interface_status(interface_name)
-            if "ACTIVE" not in status and "UP" not in status:
-                continue
+        # Bring every cached-active interface down at once; the status
+        # probes behind the cache run on a worker thread, not the loop
+        if interfaces is not None:
+            active_interfaces = interfaces
+        else:
+            active_interfaces = await asyncio.get_running_loop().run_in_executor(
+                None, self._active_interfaces
+            )
 
-            result = self.run_sudo_command(
-                ["wg-quick", "down", interface_name], timeout=20
+        results = await asyncio.gather(
+            *(
+                self._run_sudo_async(
+                    ["wg-quick", "down", interface_name],
+                    timeout=20,
+                    capture_output=False,
+                )
+                for interface_name in active_interfaces
             )
+        )
+
+        deactivated_count = 0
+        for interface_name, result in zip(active_interfaces, results):
             if result and result.returncode == 0:
                 success_msg = f"Deactivated {interface_name}"
                 self.logger.info(success_msg)
+                self._set_cached_status(interface_name, ("⚪ INACTIVE", None))
                 if not quiet:
                     print(f"✅ {success_msg}")
                 deactivated_count += 1
@@ -278,39 +898,52 @@ class WireGuardActivator:
     def show_status(self):
         """Show comprehensive status of all WireGuard interfaces."""
         self.logger.debug("Displaying comprehensive WireGuard status")
-        print("\n🔍 Comprehensive WireGuard Status:")
-        print("=" * 60)
+        lines = ["", "🔍 Comprehensive WireGuard Status:", "=" * 60]
+
+        # A single refresh feeds both sections below
+        self._refresh_status_cache()
 
         # Show all active WireGuard interfaces
-        print("\n1. Active WireGuard Interfaces:")
-        result = self.run_sudo_command(["wg", "show", "all"], timeout=15)
-        if result and result.returncode == 0:
-            if result.stdout.strip():
-                print(result.stdout)
+        lines += ["", "1. Active WireGuard Interfaces:"]
+        if self._status_cache:
+            active = self._active_interfaces()
+            if active:
+                for interface_name in active:
+                    _, details = self._status_cache.get(interface_name, (None, None))
+                    lines.append(f"interface: {interface_name}")
+                    if details:
+                        lines.append(details)
             else:
-                print("   No active WireGuard interfaces found.")
+                lines.append("   No active WireGuard interfaces found.")
         else:
-            print("   Error getting WireGuard status")
+            # Cache empty (no configs probed yet) — ask the kernel directly
+            result = self.run_sudo_fast(["wg", "show", "all"], timeout=15)
+            if result and result.returncode == 0:
+                if result.stdout.strip():
+                    lines.append(result.stdout)
+                else:
+                    lines.append("   No active WireGuard interfaces found.")
+            else:
+                lines.append("   Error getting WireGuard status")
 
-        # Show individual interface status
-        print("\n2. Individual Interface Status:")
+        # Show individual interface status, from the same refresh
+        lines += ["", "2. Individual Interface Status:"]
         for config in self.configs:
             interface_name = config.stem
-            status, _ = self.check_interface_status(interface_name)
-            print(f"   {interface_name:<15} {status}")
+            status, _ = self.get_interface_status(interface_name)
+            lines.append(f"   {interface_name:<15} {status}")
 
-    def test_connectivity(self):
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    async def test_connectivity(self):
         """Test connectivity through active WireGuard interfaces."""
         print("\n🌐 Testing Connectivity:")
         print("=" * 40)
 
-        # Find active interfaces
-        active_interfaces = []
-        for config in self.configs:
-            interface_name = config.stem
-            status, _ = self.check_interface_status(interface_name)
-            if "ACTIVE" in status or "UP" in status:
-                active_interfaces.append(interface_name)
+        # Find active interfaces (cached, same helper the menu uses)
+        active_interfaces = await asyncio.get_running_loop().run_in_executor(
+            None, self._active_interfaces
+        )
 
         if not active_interfaces:
             print("❌ No active WireGuard interfaces found.")
@@ -318,32 +951,58 @@ class WireGuardActivator:
 
         print(f"🟢 Active interfaces: {', '.join(active_interfaces)}")
 
-        # Test connectivity
+        # Test connectivity to all hosts concurrently
         test_hosts = ["8.8.8.8", "1.1.1.1"]
+        print(f"\n🔍 Testing connectivity to {', '.join(test_hosts)}...")
+
+        for host, returncode, stdout, error in await self._ping_hosts(test_hosts):
+            if error is not None:
+                print(f"❌ {host} - Error: {error}")
+            elif returncode == 0:
+                print(f"✅ {host} - Reachable")
+                # Extract ping statistics
+                for line in stdout.split("\n"):
+                    if "packet loss" in line or "min/avg/max" in line:
+                        print(f"   {line.strip()}")
+            else:
+                print(f"❌ {host} - Unreachable")
+
+    async def _ping_hosts(self, hosts):
+        """Ping all hosts in parallel and collect (host, returncode, stdout, error)."""
 
-        for host in test_hosts:
+        async def _ping(host):
             try:
-                print(f"\n🔍 Testing connectivity to {host}...")
-                result = subprocess.run(
-                    ["ping", "-c", "3", "-W", "5", host],
-                    capture_output=True,
-                    text=True,
-                    timeout=20,
+                try:
+                    ipaddress.ip_address(host)
+                    target = host
+                except ValueError:
+                    # Resolve hostnames once; ping -n then does no DNS at all
+                    infos = await asyncio.get_running_loop().getaddrinfo(host, None)
+                    target = infos[0][4][0]
+                process = await asyncio.create_subprocess_exec(
+                    "ping", "-n", "-c", "2", "-W", "2", target,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
-                if result.returncode == 0:
-                    print(f"✅ {host} - Reachable")
-                    # Extract ping statistics
-                    lines = result.stdout.split("\n")
-                    for line in lines:
-                        if "packet loss" in line or "min/avg/max" in line:
-                            print(f"   {line.strip()}")
-                else:
-                    print(f"❌ {host} - Unreachable")
+                stdout, _ = await asyncio.wait_for(process.communicate(), 10)
+                return host, process.returncode, stdout.decode(), None
             except Exception as e:
-                print(f"❌ {host} - Error: {e}")
+                return host, None, "", e
+
+        return await asyncio.gather(*(_ping(host) for host in hosts))
 
     def run(self):
         """Main application loop."""
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            # Ctrl+C cancels the main task and re-raises here, not at the
+            # inner await points — keep the friendly exit
+            self.logger.info("User interrupted with Ctrl+C")
+            print("\n\n👋 Interrupted by user. Goodbye!")
+
+    async def _main(self):
+        """Async main loop: menu in the foreground, status refresh behind it."""
         self.logger.info("WireGuard Configuration Activator started")
         print("🔧 WireGuard Configuration Activator - Enhanced")
         print("=" * 50)
@@ -353,61 +1012,81 @@ class WireGuardActivator:
             print("❌ Failed to authenticate sudo. Exiting.")
             return
 
-        while True:
-            try:
-                if not self.find_configs():
-                    self.logger.error("No configurations found. Exiting.")
-                    sys.exit(1)
-
-                self.display_configs()
-                choice = self.show_menu()
+        # Refresh interface status in the background while the user types
+        status_task = asyncio.create_task(self._status_refresher())
+        loop = asyncio.get_running_loop()
 
-                if choice == "q" or choice is None:
-                    self.logger.info("User chose to quit")
-                    print("👋 Goodbye!")
+        try:
+            while True:
+                try:
+                    if not self.find_configs():
+                        self.logger.error("No configurations found. Exiting.")
+                        sys.exit(1)
+
+                    # Probes and netlink queries must not run on the
+                    # loop thread (pyroute2 0.9's sync API spins its own
+                    # event loop internally)
+                    await loop.run_in_executor(None, self.display_configs)
+                    choice = await self.show_menu()
+
+                    if choice == "q" or choice is None:
+                        self.logger.info("User chose to quit")
+                        print("👋 Goodbye!")
+                        break
+                    elif choice == "d":
+                        self.logger.info("User chose to deactivate all interfaces")
+                        await self._deactivate_all_async()
+                    elif choice == "r":
+                        self.logger.info("User chose to refresh configurations")
+                        print("🔄 Refreshing configurations...")
+                        self._configs_mtime_ns = None
+                        continue
+                    elif choice == "s":
+                        self.logger.info("User chose to show status")
+                        await loop.run_in_executor(None, self.show_status)
+                        # Read-only action: no Enter barrier, the status
+                        # cache means the redraw costs nothing
+                        continue
+                    elif choice == "t":
+                        self.logger.info("User chose to test connectivity")
+                        await self.test_connectivity()
+                        continue
+                    else:
+                        try:
+                            choice_num = int(choice)
+                            if 1 <= choice_num <= len(self.configs):
+                                selected_config = self.configs[choice_num - 1]
+                                self.logger.info(
+                                    "User selected config %d: %s",
+                                    choice_num,
+                                    selected_config.stem,
+                                )
+                                await self.activate_config(selected_config)
+                            else:
+                                error_msg = f"Invalid choice: {choice_num}"
+                                self.logger.warning(error_msg)
+                                print(
+                                    f"❌ Please enter a number between 1 and {len(self.configs)}"
+                                )
+                        except ValueError:
+                            self.logger.warning("Invalid menu option: %r", choice)
+                            print("❌ Invalid option. Please try again.")
+
+                    await self.get_user_input("\n⏎ Press Enter to continue...")
+
+                except KeyboardInterrupt:
+                    self.logger.info("User interrupted with Ctrl+C")
+                    print("\n\n👋 Interrupted by user. Goodbye!")
                     break
-                elif choice == "d":
-                    self.logger.info("User chose to deactivate all interfaces")
-                    self.deactivate_all()
-                elif choice == "r":
-                    self.logger.info("User chose to refresh configurations")
-                    print("🔄 Refreshing configurations...")
-                    continue
-                elif choice == "s":
-                    self.logger.info("User chose to show status")
-                    self.show_status()
-                elif choice == "t":
-                    self.logger.info("User chose to test connectivity")
-                    self.test_connectivity()
-                else:
-                    try:
-                        choice_num = int(choice)
-                        if 1 <= choice_num <= len(self.configs):
-                            selected_config = self.configs[choice_num - 1]
-                            self.logger.info(
-                                f"User selected config {choice_num}: {selected_config.stem}"
-                            )
-                            self.activate_config(selected_config)
-                        else:
-                            error_msg = f"Invalid choice: {choice_num}"
-                            self.logger.warning(error_msg)
-                            print(
-                                f"❌ Please enter a number between 1 and {len(self.configs)}"
-                            )
-                    except ValueError:
-                        self.logger.warning(f"Invalid menu option: '{choice}'")
-                        print("❌ Invalid option. Please try again.")
-
-                input("\n⏎ Press Enter to continue...")
-
-            except KeyboardInterrupt:
-                self.logger.info("User interrupted with Ctrl+C")
-                print("\n\n👋 Interrupted by user. Goodbye!")
-                break
-            except Exception as e:
-                self.logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
-                print(f"❌ Unexpected error: {e}")
-                input("\n⏎ Press Enter to continue...")
+                except Exception as e:
+                    self.logger.error(
+                        "Unexpected error in main loop: %s", e, exc_info=True
+                    )
+                    print(f"❌ Unexpected error: {e}")
+                    await self.get_user_input("\n⏎ Press Enter to continue...")
+        finally:
+            status_task.cancel()
+            self._sudo_keepalive_stop.set()
 
         self.logger.info("WireGuard Configuration Activator ended")
 
@@ -455,7 +1134,7 @@ Examples:
         # Create a basic logger for critical errors
         logging.basicConfig(level=logging.ERROR)
         logger = logging.getLogger("WireGuardActivator")
-        logger.error(f"Critical error in main: {e}", exc_info=True)
+        logger.error("Critical error in main: %s", e, exc_info=True)
         print(f"💥 Critical error: {e}")
         sys.exit(1)
 